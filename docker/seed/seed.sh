@@ -1,12 +1,14 @@
 #!/bin/bash
 set -euo pipefail
 
+API_URL="${API_URL:-http://localhost:8080}"
+
 echo "Uploading seed images to S3..."
 bash docker/seed/upload_media.sh
 
 echo "Waiting for API to be ready..."
 for i in {1..30}; do
-    if curl -s http://localhost:8080/health | grep -q '"status":"ok"'; then
+    if curl -s "${API_URL}/health" | grep -q '"status":"ok"'; then
         echo "API is ready!"
         break
     fi
@@ -18,14 +20,28 @@ for i in {1..30}; do
     echo -n "."
 done
 
-echo "Clearing existing data..."
-docker compose exec -T db psql -U ciel -d ciel -c "DELETE FROM users;"
-docker compose exec -T redis redis-cli flushdb
+echo "Clearing existing data and creating bootstrap user (demo) directly in DB..."
+# Only drop rate-limit counters (so the signups below are not throttled). The
+# Lua script SCANs and UNLINKs inside Redis in a single round trip instead of
+# one redis-cli call per batch; unrelated keys are left alone.
+docker compose exec -T redis redis-cli EVAL '
+local cursor = "0"
+repeat
+  local reply = redis.call("SCAN", cursor, "MATCH", "ratelimit:*", "COUNT", 500)
+  cursor = reply[1]
+  if #reply[2] > 0 then
+    redis.call("UNLINK", unpack(reply[2]))
+  end
+until cursor == "0"
+return "OK"
+' 0 >/dev/null
 
-echo "Creating bootstrap user (demo) directly in DB..."
-# Insert demo user with a pre-computed Argon2 hash for "ChangeMe123!"
-# Then create invite codes so we can register the remaining users via the API.
+# Clear users, insert demo user with a pre-computed Argon2 hash for "ChangeMe123!",
+# then create invite codes so we can register the remaining users via the API.
+# All of it runs in one psql session: one docker exec, one database connection.
 docker compose exec -T db psql -U ciel -d ciel <<'SQL'
+DELETE FROM users;
+
 -- Create the demo user directly (bypassing invite requirement)
 INSERT INTO users (handle, email, display_name, bio, password_hash)
 VALUES (
@@ -48,23 +64,39 @@ ON CONFLICT DO NOTHING;
 SQL
 
 echo "Creating users via API..."
-# Create alice
-curl -sf -X POST http://localhost:8080/v1/users \
-  -H "Content-Type: application/json" \
-  -d '{"handle":"alice","email":"alice@example.com","display_name":"Alice","bio":"Coffee, photos, and travel.","password":"ChangeMe123!","invite_code":"SEED-ALICE-0001"}' \
-  > /dev/null || echo "  alice: already exists or failed"
-
-# Create bob
-curl -sf -X POST http://localhost:8080/v1/users \
-  -H "Content-Type: application/json" \
-  -d '{"handle":"bob","email":"bob@example.com","display_name":"Bob","bio":"Street photography enthusiast.","password":"ChangeMe123!","invite_code":"SEED-BOB-00001"}' \
-  > /dev/null || echo "  bob: already exists or failed"
+SEED_USERS=(
+  '{"handle":"alice","email":"alice@example.com","display_name":"Alice","bio":"Coffee, photos, and travel.","password":"ChangeMe123!","invite_code":"SEED-ALICE-0001"}'
+  '{"handle":"bob","email":"bob@example.com","display_name":"Bob","bio":"Street photography enthusiast.","password":"ChangeMe123!","invite_code":"SEED-BOB-00001"}'
+  '{"handle":"cora","email":"cora@example.com","display_name":"Cora","bio":"Food, friends, and sunsets.","password":"ChangeMe123!","invite_code":"SEED-CORA-0001"}'
+)
 
-# Create cora
-curl -sf -X POST http://localhost:8080/v1/users \
-  -H "Content-Type: application/json" \
-  -d '{"handle":"cora","email":"cora@example.com","display_name":"Cora","bio":"Food, friends, and sunsets.","password":"ChangeMe123!","invite_code":"SEED-CORA-0001"}' \
-  > /dev/null || echo "  cora: already exists or failed"
+# Run every signup from a single curl process: transfers run in parallel and
+# share curl's connection cache, so idle keep-alive connections are reused
+# instead of each user paying for a new process and TCP handshake.
+signup_args=()
+for payload in "${SEED_USERS[@]}"; do
+  handle=$(sed -E 's/.*"handle":"([^"]+)".*/\1/' <<< "$payload")
+  if [ ${#signup_args[@]} -gt 0 ]; then
+    signup_args+=(--next)
+  fi
+  # No fixed pacing between signups: on 429 curl waits for the server's
+  # Retry-After and tries again, so an idle limiter costs nothing.
+  signup_args+=(--retry 3 -o /dev/null -w "%{http_code} ${handle}\n" \
+    -X POST "${API_URL}/v1/users" \
+    -H "Content-Type: application/json" \
+    -d "$payload")
+done
+curl_status=0
+results=$(curl --no-progress-meter --parallel --parallel-max 4 "${signup_args[@]}") || curl_status=$?
+while read -r code handle; do
+  if [ -n "$code" ] && [ "$code" != "200" ]; then
+    echo "  ${handle}: already exists or failed (HTTP ${code})"
+  fi
+done <<< "$results"
+if [ "$curl_status" -ne 0 ]; then
+  echo "curl failed (exit ${curl_status}) while creating users"
+  exit 1
+fi
 
 echo "Creating sample content..."
 docker compose exec -T db psql -U ciel -d ciel < docker/seed/seed_content.sql
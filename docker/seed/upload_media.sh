@@ -27,9 +27,15 @@ docker compose exec -T localstack sh -c \
      thumb_key=\"seed/\${base}_thumb.jpg\"
      medium_key=\"seed/\${base}_medium.jpg\"
 
-     awslocal s3 cp \"\$f\" \"s3://ciel-media/\$key\"
-     awslocal s3 cp \"\$f\" \"s3://ciel-media/\$thumb_key\"
-     awslocal s3 cp \"\$f\" \"s3://ciel-media/\$medium_key\"
+     # The three copies are independent; run them concurrently and wait on
+     # each pid so a failed upload still fails the script.
+     awslocal s3 cp \"\$f\" \"s3://ciel-media/\$key\" &
+     p1=\$!
+     awslocal s3 cp \"\$f\" \"s3://ciel-media/\$thumb_key\" &
+     p2=\$!
+     awslocal s3 cp \"\$f\" \"s3://ciel-media/\$medium_key\" &
+     p3=\$!
+     wait \$p1 && wait \$p2 && wait \$p3 || exit 1
    done"
 
 echo "Uploaded seed images to s3://ciel-media/seed/"
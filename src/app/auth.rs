@@ -1,13 +1,15 @@
 use anyhow::{anyhow, Result};
-use argon2::password_hash::{PasswordHash, PasswordHasher, PasswordVerifier, SaltString};
-use argon2::Argon2;
+use argon2::password_hash::{self, PasswordHash, PasswordHasher, PasswordVerifier, SaltString};
+use argon2::{Algorithm, Argon2, Params, Version};
 use pasetors::claims::{Claims, ClaimsValidationRules};
 use pasetors::keys::SymmetricKey;
 use pasetors::token::UntrustedToken;
 use pasetors::{local, Local, version4::V4};
 use sha2::{Digest, Sha256};
 use sqlx::Row;
+use std::sync::Arc;
 use time::{Duration, OffsetDateTime};
+use tokio::sync::Semaphore;
 use uuid::Uuid;
 
 use crate::domain::user::User;
@@ -35,6 +37,8 @@ pub struct AuthService {
     refresh_key: [u8; 32],
     access_ttl_minutes: u64,
     refresh_ttl_days: u64,
+    password_params: Params,
+    argon2_permits: Arc<Semaphore>,
 }
 
 impl AuthService {
@@ -44,6 +48,8 @@ impl AuthService {
         refresh_key: [u8; 32],
         access_ttl_minutes: u64,
         refresh_ttl_days: u64,
+        password_params: Params,
+        argon2_permits: Arc<Semaphore>,
     ) -> Self {
         Self {
             db,
@@ -51,6 +57,8 @@ impl AuthService {
             refresh_key,
             access_ttl_minutes,
             refresh_ttl_days,
+            password_params,
+            argon2_permits,
         }
     }
 
@@ -63,10 +71,20 @@ impl AuthService {
         avatar_key: Option<String>,
         password: String,
         invite_code: String,
-    ) -> Result<User> {
-        let mut tx = self.db.pool().begin().await?;
+    ) -> Result<(User, TokenPair)> {
+        // Argon2 is CPU-bound; keep it off the async workers and hash before
+        // opening the transaction so no connection is held while it runs.
+        // The permit moves into the task so it is held until hashing ends,
+        // even if this request is dropped while waiting.
+        let permit = self.argon2_permits.clone().acquire_owned().await?;
+        let params = self.password_params.clone();
+        let password_hash = tokio::task::spawn_blocking(move || {
+            let _permit = permit;
+            hash_password(&params, &password)
+        })
+        .await??;
 
-        let password_hash = hash_password(&password)?;
+        let mut tx = self.db.pool().begin().await?;
         let row = sqlx::query(
             "INSERT INTO users (handle, email, display_name, bio, avatar_key, password_hash) \
              VALUES ($1, $2, $3, $4, $5, $6) \
@@ -102,9 +120,13 @@ impl AuthService {
             .consume_invite_with_tx(&invite_code, user.id, &mut tx)
             .await?;
 
+        // Issue tokens with the account so clients don't need a follow-up
+        // login, which would run a second Argon2 pass on the same password.
+        let tokens = self.issue_token_pair_with_tx(user.id, &mut tx).await?;
+
         tx.commit().await?;
 
-        Ok(user)
+        Ok((user, tokens.pair))
     }
 
     pub async fn login(&self, identifier: &str, password: &str) -> Result<Option<TokenPair>> {
@@ -127,7 +149,14 @@ impl AuthService {
             return Ok(None);
         }
 
-        if !verify_password(password, &password_hash)? {
+        let permit = self.argon2_permits.clone().acquire_owned().await?;
+        let password = password.to_owned();
+        let verified = tokio::task::spawn_blocking(move || {
+            let _permit = permit;
+            verify_password(&password, &password_hash)
+        })
+        .await??;
+        if !verified {
             return Ok(None);
         }
 
@@ -341,10 +370,11 @@ struct IssuedTokens {
     pair: TokenPair,
 }
 
-fn hash_password(password: &str) -> Result<String> {
+/// Hash a password into a PHC-format Argon2id string using the given cost
+/// parameters (see `AppConfig::password_params`).
+pub fn hash_password(params: &Params, password: &str) -> Result<String> {
     let salt = SaltString::generate(&mut argon2::password_hash::rand_core::OsRng);
-    let argon2 = Argon2::default();
-    let hash = argon2
+    let hash = Argon2::new(Algorithm::Argon2id, Version::V0x13, params.clone())
         .hash_password(password.as_bytes(), &salt)
         .map_err(|err| anyhow!("failed to hash password: {}", err))?;
     Ok(hash.to_string())
@@ -353,9 +383,13 @@ fn hash_password(password: &str) -> Result<String> {
 fn verify_password(password: &str, hash: &str) -> Result<bool> {
     let parsed = PasswordHash::new(hash)
         .map_err(|err| anyhow!("failed to parse password hash: {}", err))?;
-    Ok(Argon2::default()
-        .verify_password(password.as_bytes(), &parsed)
-        .is_ok())
+    // Verification uses the cost parameters encoded in the stored hash, so
+    // hashes created under older settings keep working after a change.
+    match Argon2::default().verify_password(password.as_bytes(), &parsed) {
+        Ok(()) => Ok(true),
+        Err(password_hash::Error::Password) => Ok(false),
+        Err(err) => Err(anyhow!("failed to verify password: {}", err)),
+    }
 }
 
 fn hash_token(token: &str) -> String {
@@ -1,6 +1,7 @@
 pub mod rate_limits;
 
 use anyhow::{anyhow, Result};
+use argon2::Params;
 use base64::engine::general_purpose::STANDARD;
 use base64::Engine;
 use std::net::SocketAddr;
@@ -31,6 +32,7 @@ pub struct AppConfig {
     pub access_ttl_minutes: u64,
     pub refresh_ttl_days: u64,
     pub ip_signup_rate_limit: u32,
+    pub password_params: Params,
 }
 
 impl AppConfig {
@@ -70,6 +72,7 @@ impl AppConfig {
             access_ttl_minutes: env_or_parse("ACCESS_TTL_MINUTES", "15")?,
             refresh_ttl_days: env_or_parse("REFRESH_TTL_DAYS", "30")?,
             ip_signup_rate_limit: env_or_parse("IP_SIGNUP_RATE_LIMIT", "3")?,
+            password_params: password_params_from_env()?,
         })
     }
 }
@@ -93,6 +96,19 @@ where
         .map_err(|err| anyhow!("invalid {}: {}", key, err))
 }
 
+/// Argon2id cost for new password hashes. The defaults (19 MiB, t=2, p=1) are
+/// the OWASP baseline; on memory-constrained hosts the equivalent profile
+/// `ARGON2_MEMORY_KIB=7168 ARGON2_ITERATIONS=5` cuts per-hash memory ~2.7x
+/// at the price of more passes. Lowering memory weakens resistance to GPU
+/// cracking, so keep to the OWASP-equivalent profiles in production.
+fn password_params_from_env() -> Result<Params> {
+    let memory_kib: u32 = env_or_parse("ARGON2_MEMORY_KIB", "19456")?;
+    let iterations: u32 = env_or_parse("ARGON2_ITERATIONS", "2")?;
+    let parallelism: u32 = env_or_parse("ARGON2_PARALLELISM", "1")?;
+    Params::new(memory_kib, iterations, parallelism, Some(32))
+        .map_err(|err| anyhow!("invalid Argon2 parameters: {}", err))
+}
+
 fn env_key_32(key: &str) -> Result<[u8; 32]> {
     let value = env_or_err(key)?;
     let decoded = STANDARD
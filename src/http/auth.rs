@@ -44,6 +44,8 @@ impl FromRequestParts<AppState> for AuthUser {
             app_state.paseto_refresh_key,
             app_state.access_ttl_minutes,
             app_state.refresh_ttl_days,
+            app_state.password_params.clone(),
+            app_state.argon2_permits.clone(),
         );
         let session = service
             .authenticate_access_token(token)
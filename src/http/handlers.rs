@@ -135,6 +135,8 @@ pub async fn login(
         state.paseto_refresh_key,
         state.access_ttl_minutes,
         state.refresh_ttl_days,
+        state.password_params.clone(),
+        state.argon2_permits.clone(),
     );
     let tokens = service
         .login(&payload.email, &payload.password)
@@ -174,6 +176,8 @@ pub async fn refresh_token(
         state.paseto_refresh_key,
         state.access_ttl_minutes,
         state.refresh_ttl_days,
+        state.password_params.clone(),
+        state.argon2_permits.clone(),
     );
     let tokens = service
         .refresh(&payload.refresh_token)
@@ -213,6 +217,8 @@ pub async fn revoke_token(
         state.paseto_refresh_key,
         state.access_ttl_minutes,
         state.refresh_ttl_days,
+        state.password_params.clone(),
+        state.argon2_permits.clone(),
     );
     let revoked = service
         .revoke_refresh_token(&payload.refresh_token)
@@ -236,6 +242,8 @@ pub async fn get_current_user(
         state.paseto_refresh_key,
         state.access_ttl_minutes,
         state.refresh_ttl_days,
+        state.password_params.clone(),
+        state.argon2_permits.clone(),
     );
     let user = service
         .get_current_user(auth.user_id)
@@ -302,10 +310,18 @@ pub struct CreateUserRequest {
     pub invite_code: String,
 }
 
+#[derive(Serialize)]
+pub struct CreateUserResponse {
+    #[serde(flatten)]
+    pub user: crate::domain::user::User,
+    #[serde(flatten)]
+    pub tokens: AuthTokenResponse,
+}
+
 pub async fn create_user(
     State(state): State<AppState>,
     Json(payload): Json<CreateUserRequest>,
-) -> Result<Json<crate::domain::user::User>, AppError> {
+) -> Result<Json<CreateUserResponse>, AppError> {
     // Validate handle format
     validate_handle(&payload.handle)?;
     
@@ -357,8 +373,10 @@ pub async fn create_user(
         state.paseto_refresh_key,
         state.access_ttl_minutes,
         state.refresh_ttl_days,
+        state.password_params.clone(),
+        state.argon2_permits.clone(),
     );
-    let user = service
+    let (mut user, tokens) = service
         .signup(
             payload.handle,
             payload.email,
@@ -394,7 +412,6 @@ pub async fn create_user(
         })?;
 
     // Populate avatar URL if avatar_key exists
-    let mut user = user;
     let media_svc = MediaService::new(
         state.db.clone(),
         state.cache.clone(),
@@ -404,7 +421,15 @@ pub async fn create_user(
     );
     media_svc.populate_user_avatar_url(&mut user).await;
 
-    Ok(Json(user))
+    Ok(Json(CreateUserResponse {
+        user,
+        tokens: AuthTokenResponse {
+            access_token: tokens.access_token,
+            refresh_token: tokens.refresh_token,
+            access_expires_at: tokens.access_expires_at,
+            refresh_expires_at: tokens.refresh_expires_at,
+        },
+    }))
 }
 
 #[derive(Deserialize)]
@@ -5,6 +5,9 @@ pub mod http;
 pub mod infra;
 pub mod jobs;
 
+use std::sync::Arc;
+use tokio::sync::Semaphore;
+
 use crate::infra::{cache::RedisCache, db::Db, queue::QueueClient, storage::ObjectStorage};
 
 #[derive(Clone)]
@@ -22,4 +25,17 @@ pub struct AppState {
     pub refresh_ttl_days: u64,
     pub s3_public_endpoint: Option<String>,
     pub ip_signup_rate_limit: u32,
+    pub password_params: argon2::Params,
+    /// Caps concurrent Argon2 runs (one per core) so their memory stays bounded.
+    pub argon2_permits: Arc<Semaphore>,
+}
+
+impl AppState {
+    /// Semaphore for `argon2_permits`, sized to the available cores.
+    pub fn argon2_permits() -> Arc<Semaphore> {
+        let cores = std::thread::available_parallelism()
+            .map(|n| n.get())
+            .unwrap_or(1);
+        Arc::new(Semaphore::new(cores))
+    }
 }
@@ -51,6 +51,8 @@ async fn main() -> anyhow::Result<()> {
         refresh_ttl_days: config.refresh_ttl_days,
         s3_public_endpoint: config.s3_public_endpoint,
         ip_signup_rate_limit: config.ip_signup_rate_limit,
+        password_params: config.password_params,
+        argon2_permits: AppState::argon2_permits(),
     };
 
     match config.app_mode.as_str() {
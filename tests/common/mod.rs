@@ -1,7 +1,5 @@
 #![allow(dead_code)]
 
-use argon2::password_hash::{PasswordHasher, SaltString};
-use argon2::Argon2;
 use axum::body::Body;
 use axum::extract::connect_info::ConnectInfo;
 use axum::http::{Method, Request, StatusCode};
@@ -13,11 +11,12 @@ use serde_json::Value;
 use sqlx::postgres::PgPoolOptions;
 use sqlx::PgPool;
 use std::net::SocketAddr;
+use std::sync::OnceLock;
 use tokio::sync::OnceCell;
 use tower::ServiceExt;
 use uuid::Uuid;
 
-use ciel::app::auth::AuthService;
+use ciel::app::auth::{hash_password, AuthService};
 use ciel::config::AppConfig;
 use ciel::infra::{cache::RedisCache, db::Db, queue::QueueClient, storage::ObjectStorage};
 use ciel::AppState;
@@ -67,6 +66,7 @@ pub struct TestUser {
 }
 
 static TEST_APP: OnceCell<TestApp> = OnceCell::const_new();
+static DEFAULT_PASSWORD_HASH: OnceLock<String> = OnceLock::new();
 
 /// Get (or lazily create) the shared TestApp instance.
 pub async fn app() -> &'static TestApp {
@@ -142,11 +142,15 @@ impl TestApp {
         }
 
         // ---- Truncate all tables for clean test state ----
+        // One TRUNCATE over every table: a single statement and lock pass
+        // instead of one CASCADE truncate per table.
         sqlx::raw_sql(
-            "DO $$ DECLARE r RECORD; BEGIN \
-             FOR r IN (SELECT tablename FROM pg_tables WHERE schemaname = 'public') LOOP \
-             EXECUTE 'TRUNCATE TABLE ' || quote_ident(r.tablename) || ' CASCADE'; \
-             END LOOP; END $$;",
+            "DO $$ DECLARE tables TEXT; BEGIN \
+             SELECT string_agg(quote_ident(tablename), ', ') INTO tables \
+             FROM pg_tables WHERE schemaname = 'public'; \
+             IF tables IS NOT NULL THEN \
+             EXECUTE 'TRUNCATE TABLE ' || tables || ' CASCADE'; \
+             END IF; END $$;",
         )
         .execute(&db_pool)
         .await
@@ -229,6 +233,8 @@ impl TestApp {
             refresh_ttl_days: config.refresh_ttl_days,
             s3_public_endpoint: config.s3_public_endpoint,
             ip_signup_rate_limit: 100,
+            password_params: config.password_params,
+            argon2_permits: AppState::argon2_permits(),
         };
 
         let router = ciel::http::router(state.clone());
@@ -366,12 +372,11 @@ impl TestApp {
         let display_name = format!("Test User {}", suffix);
         let password = DEFAULT_PASSWORD;
 
-        // Hash password with Argon2 (same algorithm as production)
-        let salt = SaltString::generate(&mut argon2::password_hash::rand_core::OsRng);
-        let hash = Argon2::default()
-            .hash_password(password.as_bytes(), &salt)
-            .expect("password hash failed")
-            .to_string();
+        // Hash password with the production Argon2 helper. Every test user
+        // shares DEFAULT_PASSWORD, so compute the hash once per binary.
+        let hash = DEFAULT_PASSWORD_HASH.get_or_init(|| {
+            hash_password(&self.state.password_params, password).expect("password hash failed")
+        });
 
         let pool = self.state.db.pool();
 
@@ -383,7 +388,7 @@ impl TestApp {
         .bind(&handle)
         .bind(&email)
         .bind(&display_name)
-        .bind(&hash)
+        .bind(hash)
         .fetch_one(pool)
         .await
         .expect("insert test user failed");
@@ -405,6 +410,8 @@ impl TestApp {
             self.state.paseto_refresh_key,
             self.state.access_ttl_minutes,
             self.state.refresh_ttl_days,
+            self.state.password_params.clone(),
+            self.state.argon2_permits.clone(),
         );
         let tokens = auth_service
             .issue_token_pair(user_id)
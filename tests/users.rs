@@ -39,6 +39,13 @@ async fn signup_valid_data() {
     assert_eq!(body["handle"].as_str().unwrap(), "newuser_reg");
     assert_eq!(body["email"].as_str().unwrap(), "newuser_reg@example.com");
     assert_eq!(body["display_name"].as_str().unwrap(), "New User");
+
+    // Signup returns a session, so no separate login is needed
+    let access_token = body["access_token"].as_str().expect("missing access_token");
+    assert!(body["refresh_token"].is_string());
+    let me = app.get("/v1/auth/me", Some(access_token)).await;
+    assert_eq!(me.status, StatusCode::OK);
+    assert_eq!(me.json()["handle"].as_str().unwrap(), "newuser_reg");
 }
 
 #[tokio::test]